@@ -388,6 +388,22 @@ def _validate_parameter_value(param: AppParameter, value, session=None, username
     return str_val
 
 
+def _validate_default_value(param: AppParameter, session=None, username=None,
+                            check_access: bool = True) -> str:
+    """Validate a parameter's manifest default, reusing the result when possible.
+
+    Defaults are static per manifest, so for every type except file/directory
+    (whose validation depends on the target user and the mounted shares) the
+    validated string is cached on the parameter after the first submission.
+    """
+    if param.type in ("file", "directory"):
+        return _validate_parameter_value(param, param.default, session=session,
+                                         username=username, check_access=check_access)
+    if param._validated_default is None:
+        param._validated_default = _validate_parameter_value(param, param.default)
+    return param._validated_default
+
+
 def _flatten_param_items(items) -> list:
     """Flatten a list of AppParameter / AppParameterSection items into params."""
     result = []
@@ -424,25 +440,30 @@ def build_command(entry_point: AppEntryPoint, parameters: dict,
     groups = ((env_flat, env_parameters), (param_flat, parameters))
 
     for flat, values in groups:
-        # Validate required parameters
+        # Validate required parameters, collecting known keys in the same pass
+        keys = set()
         for param in flat:
             if param.required and param.key not in values and param.default is None:
                 raise ValueError(f"Required parameter '{param.name}' is missing")
+            keys.add(param.key)
         # Check for unknown parameters
-        keys = {p.key for p in flat}
         for param_key in values:
             if param_key not in keys:
                 raise ValueError(f"Unknown parameter '{param_key}'")
 
     # Compute effective values (user-provided merged with defaults), keeping
     # env-then-pipeline declaration order across the combined list.
-    effective: list[tuple[AppParameter, any]] = []
+    # Each entry also records whether the value came from the manifest default,
+    # so its validated form can be reused across submissions.
+    effective: list[tuple[AppParameter, any, bool]] = []
     for flat, values in groups:
         for param in flat:
             if param.key in values:
                 value = values[param.key]
+                is_default = False
             elif param.default is not None:
                 value = param.default
+                is_default = True
             else:
                 continue
             # An optional flagged param with an empty value (an empty-string
@@ -452,17 +473,23 @@ def build_command(entry_point: AppEntryPoint, parameters: dict,
             # empty value so validation raises a clear error.
             if value == "" and not param.required and param.flag is not None:
                 continue
-            effective.append((param, value))
+            effective.append((param, value, is_default))
+
+    def validate(p, value, is_default):
+        if is_default:
+            return _validate_default_value(p, session=session, username=username,
+                                           check_access=check_access)
+        return _validate_parameter_value(p, value, session=session, username=username,
+                                         check_access=check_access)
 
     # Start with the base command
     parts = [entry_point.command]
 
     # Pass 1: Flagged args in declaration order
-    for p, value in effective:
+    for p, value, is_default in effective:
         if p.flag is None:
             continue
-        validated = _validate_parameter_value(p, value, session=session, username=username,
-                                              check_access=check_access)
+        validated = validate(p, value, is_default)
         if p.type == "boolean":
             if value is True:
                 parts.append(p.flag)
@@ -470,11 +497,10 @@ def build_command(entry_point: AppEntryPoint, parameters: dict,
             parts.append(f"{p.flag} {shlex.quote(validated)}")
 
     # Pass 2: Positional args in declaration order
-    for p, value in effective:
+    for p, value, is_default in effective:
         if p.flag is not None:
             continue
-        validated = _validate_parameter_value(p, value, session=session, username=username,
-                                              check_access=check_access)
+        validated = validate(p, value, is_default)
         if p.raw:
             if _SHELL_METACHAR_PATTERN.search(validated):
                 raise ValueError(
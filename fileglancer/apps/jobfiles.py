@@ -1,5 +1,6 @@
 """Job working-directory path construction and job file access."""
 
+import functools
 import ntpath
 import os
 import posixpath
@@ -11,9 +12,17 @@ from fileglancer import database as db
 from fileglancer.settings import get_settings
 
 
+_UNSAFE_PATH_CHARS = re.compile(r'[^a-zA-Z0-9._-]')
+
+
+@functools.lru_cache(maxsize=1024)
 def _sanitize_for_path(s: str) -> str:
-    """Sanitize a string for use in a directory name."""
-    return re.sub(r'[^a-zA-Z0-9._-]', '_', s)
+    """Sanitize a string for use in a directory name.
+
+    App names and entry point ids repeat across every job, so results are
+    memoized.
+    """
+    return _UNSAFE_PATH_CHARS.sub('_', s)
 
 
 def _build_work_dir(job_id: int, app_name: str, entry_point_id: str,
@@ -164,15 +173,31 @@ def get_job_file_paths(db_job: db.JobDB) -> dict[str, dict]:
     return files
 
 
-def read_job_file(db_job, file_type: str) -> Optional[str]:
-    """Read the content of a job file given a loaded job record.
+def _first_script(work_dir: Path) -> Optional[Path]:
+    """Return the alphabetically first *.sh file in work_dir, or None.
+
+    A single scandir pass keeping the running minimum, rather than building
+    and sorting the full glob result just to take its first entry.
+    """
+    first = None
+    try:
+        with os.scandir(work_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.endswith(".sh") and (first is None or name < first):
+                    first = name
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return work_dir / first if first else None
+
+
+def _job_file_path(db_job, file_type: str) -> Optional[Path]:
+    """Locate a job file on disk, or return None if it doesn't exist.
 
     All job files live in the job's work directory:
       - *.sh        — the generated script (written by cluster-api)
       - stdout.log  — captured standard output
       - stderr.log  — captured standard error
-
-    Returns the file content as a string, or None if the file doesn't exist.
     """
     work_dir = _resolve_work_dir(db_job)
 
@@ -182,11 +207,8 @@ def read_job_file(db_job, file_type: str) -> Optional[str]:
         script_path = getattr(db_job, 'script_path', None)
         if script_path:
             path = Path(script_path)
-            return path.read_text() if path.is_file() else None
-        scripts = sorted(work_dir.glob("*.sh"))
-        if scripts:
-            return scripts[0].read_text()
-        return None
+            return path if path.is_file() else None
+        return _first_script(work_dir)
     elif file_type == "stdout":
         path = work_dir / "stdout.log"
     elif file_type == "stderr":
@@ -194,9 +216,39 @@ def read_job_file(db_job, file_type: str) -> Optional[str]:
     else:
         raise ValueError(f"Unknown file type: {file_type}")
 
-    if path.is_file():
-        return path.read_text()
-    return None
+    return path if path.is_file() else None
+
+
+def read_job_file(db_job, file_type: str) -> Optional[str]:
+    """Read the content of a job file given a loaded job record.
+
+    Returns the file content as a string, or None if the file doesn't exist.
+    """
+    path = _job_file_path(db_job, file_type)
+    if path is None:
+        return None
+    return path.read_text()
+
+
+def read_job_file_tail(db_job, file_type: str,
+                       max_bytes: int) -> Optional[tuple[str, int]]:
+    """Read at most the last max_bytes of a job file.
+
+    Long-running jobs can write very large logs, so callers that only need the
+    end of a file can avoid loading (and decoding) all of it. A multi-byte
+    character split at the cut point is replaced rather than raising.
+
+    Returns (content, total_size_in_bytes), or None if the file doesn't exist.
+    """
+    path = _job_file_path(db_job, file_type)
+    if path is None:
+        return None
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > max_bytes:
+            f.seek(size - max_bytes)
+        data = f.read(max_bytes)
+    return data.decode("utf-8", errors="replace"), size
 
 
 def get_job_file_content(job_id: int, username: str, file_type: str) -> Optional[str]:
@@ -211,6 +211,10 @@ async def _poll_loop(settings):
 async def _poll_jobs(settings):
     """Run one poll cycle: query bjobs via worker, update DB.
 
+    The DB session is not held across the worker round-trip: active jobs are
+    snapshotted up front, and all status changes are written afterwards as a
+    single batch.
+
     Returns True if there are active jobs to continue polling,
     False if the loop can stop.
     """
@@ -222,12 +226,15 @@ async def _poll_jobs(settings):
 
         # Handle zombie jobs (no cluster_job_id after timeout)
         jobs_to_poll = []
+        zombie_updates = []
         for db_job in active_jobs:
             if not db_job.cluster_job_id:
                 created = db_job.created_at.replace(tzinfo=None) if db_job.created_at.tzinfo else db_job.created_at
                 age_minutes = (datetime.now(UTC).replace(tzinfo=None) - created).total_seconds() / 60
                 if age_minutes > settings.cluster.zombie_timeout_minutes:
-                    db.update_job_status(session, db_job.id, "FAILED", finished_at=datetime.now(UTC))
+                    zombie_updates.append({
+                        "id": db_job.id, "status": "FAILED", "finished_at": datetime.now(UTC),
+                    })
                     logger.warning(
                         f"Job {db_job.id} has no cluster_job_id after "
                         f"{age_minutes:.0f} minutes, marked FAILED"
@@ -235,60 +242,70 @@ async def _poll_jobs(settings):
                 continue
             jobs_to_poll.append(db_job)
 
-        if not jobs_to_poll:
-            return True  # zombie jobs still pending, keep polling
-
         # Local executor: poll by checking PID files instead of spawning
         # a worker subprocess (which would create a fresh executor with
         # no knowledge of the running processes).
-        if settings.cluster.executor == "local":
+        if jobs_to_poll and settings.cluster.executor == "local":
+            if zombie_updates:
+                db.update_job_statuses(session, zombie_updates)
             return _poll_local_jobs(session, jobs_to_poll)
 
-        # Pick any user to run the poll through. py-cluster-api will query
-        # each cluster_job_id explicitly; LSF allows querying jobs by ID
-        # across users, so one worker's call covers everyone's jobs.
-        poll_username = jobs_to_poll[0].username
-        # Pass current known statuses so stubs are seeded correctly.
-        # Without this, stubs default to PENDING and jobs whose status
-        # bjobs doesn't return would revert to PENDING in the DB.
-        job_statuses = {
-            j.cluster_job_id: j.status for j in jobs_to_poll
-        }
+        # Snapshot what the poll needs before committing, which expires the
+        # loaded rows.
+        polled = [(j.id, j.cluster_job_id, j.status) for j in jobs_to_poll]
+        poll_username = jobs_to_poll[0].username if jobs_to_poll else None
+        if zombie_updates:
+            db.update_job_statuses(session, zombie_updates)
 
-        cluster_config = settings.cluster.model_dump(exclude_none=True)
-        try:
-            result = await _dispatch(
-                poll_username, "poll",
-                cluster_config=cluster_config,
-                cluster_job_ids=list(job_statuses.keys()),
-                job_statuses=job_statuses,
-            )
-        except Exception as e:
-            logger.warning(f"Poll failed: {e}")
-            return True  # keep polling on error
+    if not polled:
+        return True  # zombie jobs still pending, keep polling
 
-        polled_jobs = result.get("jobs", {})
+    # Pick any user to run the poll through. py-cluster-api will query
+    # each cluster_job_id explicitly; LSF allows querying jobs by ID
+    # across users, so one worker's call covers everyone's jobs.
+    # Pass current known statuses so stubs are seeded correctly.
+    # Without this, stubs default to PENDING and jobs whose status
+    # bjobs doesn't return would revert to PENDING in the DB.
+    job_statuses = {cluster_job_id: status for _, cluster_job_id, status in polled}
 
-        # Update DB with polled statuses
-        for db_job in jobs_to_poll:
-            info = polled_jobs.get(db_job.cluster_job_id)
-            if info is None:
-                continue
-            new_status = info["status"].upper()
-            old_status = db_job.status
-            if new_status == old_status:
-                continue
-            is_terminal = new_status in ("DONE", "FAILED", "KILLED")
-            finished_at = _parse_iso_dt(info.get("finish_time")) if is_terminal else None
-            db.update_job_status(
-                session, db_job.id, new_status,
-                exit_code=info.get("exit_code") if is_terminal else None,
-                started_at=_parse_iso_dt(info.get("start_time")),
-                finished_at=finished_at,
-            )
-            logger.info(f"Job {db_job.id} status updated: {old_status} -> {new_status}")
+    cluster_config = settings.cluster.model_dump(exclude_none=True)
+    try:
+        result = await _dispatch(
+            poll_username, "poll",
+            cluster_config=cluster_config,
+            cluster_job_ids=list(job_statuses.keys()),
+            job_statuses=job_statuses,
+        )
+    except Exception as e:
+        logger.warning(f"Poll failed: {e}")
+        return True  # keep polling on error
+
+    polled_jobs = result.get("jobs", {})
+
+    # Collect status changes, then write them in one batch
+    updates = []
+    for job_id, cluster_job_id, old_status in polled:
+        info = polled_jobs.get(cluster_job_id)
+        if info is None:
+            continue
+        new_status = info["status"].upper()
+        if new_status == old_status:
+            continue
+        is_terminal = new_status in ("DONE", "FAILED", "KILLED")
+        updates.append({
+            "id": job_id,
+            "status": new_status,
+            "exit_code": info.get("exit_code") if is_terminal else None,
+            "started_at": _parse_iso_dt(info.get("start_time")),
+            "finished_at": _parse_iso_dt(info.get("finish_time")) if is_terminal else None,
+        })
+        logger.info(f"Job {job_id} status updated: {old_status} -> {new_status}")
+
+    if updates:
+        with db.get_db_session(settings.db_url) as session:
+            db.update_job_statuses(session, updates)
 
-        return True
+    return True
 
 
 def _poll_local_jobs(session, jobs_to_poll: list) -> bool:
@@ -464,12 +481,7 @@ async def submit_job(
     # Read manifest from the cache when available; fall back to disk.
     manifest = await get_or_load_manifest(username, app_url, manifest_path)
 
-    # Find entry point
-    entry_point = None
-    for ep in manifest.runnables:
-        if ep.id == entry_point_id:
-            entry_point = ep
-            break
+    entry_point = manifest.runnables_by_id.get(entry_point_id)
     if entry_point is None:
         raise ValueError(f"Entry point '{entry_point_id}' not found in manifest")
 
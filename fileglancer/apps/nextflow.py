@@ -5,6 +5,8 @@ optionally enriched with metadata from nextflow.config.
 """
 
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 
 from fileglancer.model import (
@@ -17,6 +19,23 @@ from fileglancer.model import (
 _NEXTFLOW_SCHEMA_FILENAME = "nextflow_schema.json"
 
 
+@lru_cache(maxsize=32)
+def _load_schema_cached(path: str, mtime_ns: int, size: int) -> dict:
+    # mtime_ns and size are only part of the cache key, so an edited or
+    # re-pulled schema is re-read.
+    with open(path, "rb") as f:
+        return json.load(f)
+
+
+def _load_schema(schema_path: Path) -> dict:
+    """Parse nextflow_schema.json, reusing the result while the file is unchanged.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    st = os.stat(schema_path)
+    return _load_schema_cached(str(schema_path), st.st_mtime_ns, st.st_size)
+
+
 def _convert_property_type(prop: dict) -> str:
     """Map a nextflow_schema.json property to an AppParameter type string."""
     if "enum" in prop:
@@ -97,7 +116,7 @@ class NextflowAdapter:
 
     def convert(self, directory: Path) -> AppManifest:
         schema_path = directory / _NEXTFLOW_SCHEMA_FILENAME
-        schema = json.loads(schema_path.read_text())
+        schema = _load_schema(schema_path)
 
         # Determine app metadata — use owner/repo from the cache path
         # (directory is {cache_base}/{owner}/{repo}/{branch})
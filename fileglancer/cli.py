@@ -9,7 +9,6 @@ import signal
 import sys
 import asyncio
 import click
-import uvicorn
 import json
 import webbrowser
 import threading
@@ -19,11 +18,10 @@ from pathlib import Path
 from datetime import datetime, timedelta, UTC
 from loguru import logger
 
-from fileglancer import database as db
-
 
 def run_server_with_interrupt_handler(config, url, cleanup_callback=None):
     """Run uvicorn server in a thread with custom interrupt handling in main thread"""
+    import uvicorn
 
     server = uvicorn.Server(config)
     server_thread = None
@@ -141,6 +139,10 @@ def start(host, port, reload, workers, ssl_keyfile, ssl_certfile,
           ssl_ca_certs, ssl_version, ssl_cert_reqs, ssl_ciphers, timeout_keep_alive, auto_port, no_browser,
           file_share_mounts):
     """Start the Fileglancer server using uvicorn."""
+    # Imported here rather than at module level so that `fileglancer --help`
+    # and `--version` don't pay for loading uvicorn, SQLAlchemy and the models.
+    import uvicorn
+    from fileglancer import database as db
 
     # Set file share mounts from CLI if provided
     if file_share_mounts:
@@ -173,21 +175,20 @@ def start(host, port, reload, workers, ssl_keyfile, ssl_certfile,
 
     # Find available port if auto_port is enabled
     if auto_port:
-        import socket
+        # Try the requested port first; if it's taken, let the OS pick a free
+        # one instead of probing successive ports.
         original_port = port
-        max_attempts = 100
-        for attempt in range(max_attempts):
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            try:
+                s.bind((host, port))
+            except OSError:
                 try:
-                    s.bind((host, port))
-                    if port != original_port:
-                        logger.info(f"Port {original_port} in use, trying port {port} instead")
-                    break
-                except OSError:
-                    port += 1
-        else:
-            logger.error(f"Could not find an available port after {max_attempts} attempts starting from {original_port}")
-            return
+                    s.bind((host, 0))
+                except OSError as e:
+                    logger.error(f"Could not find an available port on {host}: {e}")
+                    return
+                port = s.getsockname()[1]
+                logger.info(f"Port {original_port} in use, using port {port} instead")
 
     # Build uvicorn config
     config_kwargs = {
@@ -252,9 +253,16 @@ def start(host, port, reload, workers, ssl_keyfile, ssl_certfile,
     if ssl_ciphers:
         config_kwargs['ssl_ciphers'] = ssl_ciphers
 
-    def wait_for_server_and_open_browser(url, host, port, max_attempts=30, check_interval=0.5):
-        """Wait for server to be ready, then open browser"""
-        for attempt in range(max_attempts):
+    def wait_for_server_and_open_browser(url, host, port, timeout=15.0,
+                                         initial_delay=0.02, max_delay=0.5):
+        """Wait for server to be ready, then open browser.
+
+        Polls quickly at first (uvicorn usually starts in well under a second)
+        and backs off exponentially up to max_delay between checks.
+        """
+        deadline = time.monotonic() + timeout
+        delay = initial_delay
+        while time.monotonic() < deadline:
             try:
                 with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                     s.settimeout(1)
@@ -266,9 +274,10 @@ def start(host, port, reload, workers, ssl_keyfile, ssl_certfile,
                         return
             except Exception:
                 pass
-            time.sleep(check_interval)
+            time.sleep(delay)
+            delay = min(delay * 1.5, max_delay)
 
-        logger.warning(f"Server did not become ready after {max_attempts * check_interval:.1f}s, could not open browser")
+        logger.warning(f"Server did not become ready after {timeout:.1f}s, could not open browser")
 
     # Set up browser opening if not disabled
     cli_session_id = None
@@ -4,8 +4,9 @@ from datetime import datetime, timedelta, UTC
 import os
 from functools import lru_cache
 
-from sqlalchemy import create_engine, Column, String, Integer, DateTime, JSON, UniqueConstraint
+from sqlalchemy import create_engine, update, Column, String, Integer, DateTime, JSON, UniqueConstraint
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
+from sqlalchemy.orm.exc import StaleDataError
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.pool import StaticPool
 from typing import Optional, Dict, List
@@ -634,6 +635,16 @@ def _find_best_fsp_match(
     return (best_fsp, subpath)
 
 
+@lru_cache(maxsize=256)
+def _canonical_mount_path(expanded_mount_path: str) -> str:
+    """Resolve a file share mount to its canonical path.
+
+    Mounts are fixed for the life of the process, and find_fsp_in_paths runs
+    for every symlink in a listing, so the realpath walk is done once per mount.
+    """
+    return os.path.realpath(expanded_mount_path)
+
+
 def find_fsp_in_paths(
     paths: list[FileSharePath], absolute_path: str
 ) -> Optional[tuple[FileSharePath, str]]:
@@ -655,7 +666,7 @@ def find_fsp_in_paths(
     expanded_mounts: dict[str, str] = {}
     for fsp in paths:
         expanded = os.path.expanduser(fsp.mount_path)
-        expanded_mounts[fsp.name] = os.path.realpath(expanded)
+        expanded_mounts[fsp.name] = _canonical_mount_path(expanded)
 
     def _expanded_mount(fsp: FileSharePath):
         return [expanded_mounts[fsp.name]]
@@ -1042,6 +1053,40 @@ def update_job_status(session: Session, job_id: int, status: str,
     return job
 
 
+def update_job_statuses(session: Session, updates: List[Dict]) -> int:
+    """Apply several job status updates as one batch with a single commit.
+
+    Each dict must have "id" and "status"; any other JobDB column may be
+    included. As with update_job_status, keys whose value is None are left
+    untouched and ids that no longer exist (e.g. a job deleted while its
+    poll was in flight) are skipped. Rows are written with an ORM bulk
+    UPDATE by primary key rather than loaded one at a time. Returns the
+    number of jobs updated.
+    """
+    rows = [{k: v for k, v in u.items() if v is not None} for u in updates]
+    if not rows:
+        return 0
+    try:
+        session.execute(update(JobDB), rows)
+        session.commit()
+        return len(rows)
+    except StaleDataError:
+        # The bulk UPDATE checks that every id matched. Redo the batch one
+        # row at a time so the remaining jobs still get their updates.
+        session.rollback()
+
+    updated = 0
+    for row in rows:
+        values = dict(row)
+        job_id = values.pop("id")
+        result = session.execute(
+            update(JobDB).where(JobDB.id == job_id).values(**values)
+        )
+        updated += result.rowcount
+    session.commit()
+    return updated
+
+
 def delete_job(session: Session, job_id: int, username: str) -> bool:
     """Delete a single job record. Returns True if deleted, False if not found."""
     deleted = session.query(JobDB).filter_by(id=job_id, username=username).delete()
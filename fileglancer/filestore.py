@@ -13,16 +13,136 @@ except ImportError:
     pwd = None  # type: ignore[assignment]
     grp = None  # type: ignore[assignment]
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+from cachetools import TTLCache
 from pydantic import BaseModel
 from typing import Optional, Generator
 from loguru import logger
 
 from .database import find_fsp_in_paths
 from .model import FileSharePath
+from .utils import is_likely_binary
+
+# Default buffer size for streaming file contents. StreamingResponse pulls
+# each chunk from these sync generators via a threadpool hop, so small chunks
+# mean many hops per download; this matches the S3 proxy's buffer size.
+DEFAULT_BUFFER_SIZE = 256 * 1024
+# Whole-file streams grow their reads up to this size once the file has
+# proven to be longer than a few buffers.
+MAX_STREAM_BUFFER_SIZE = 1024 * 1024
+# How far ahead of the read position byte-range streams ask the kernel to
+# prefetch. Bounded so an open-ended range on a huge file doesn't pull the
+# whole file into the page cache for a download that may be abandoned.
+_READAHEAD_WINDOW = 4 * MAX_STREAM_BUFFER_SIZE
+
+# Group memberships by username. Listings and file info lookups happen many
+# times per page view, and walking the group database is slow on LDAP/NIS
+# hosts, so memberships are reused for a few minutes. The worker's profile
+# action reads the same cache.
+_USER_GROUPS_TTL_SECONDS = 300
+_user_groups_cache: TTLCache = TTLCache(maxsize=256, ttl=_USER_GROUPS_TTL_SECONDS)
+_user_groups_lock = threading.Lock()
+
+
+# Listings stat their entries on a shared thread pool, in chunks. On network
+# file systems every stat (and owner/group lookup) is a round trip, so issuing
+# them concurrently hides most of the latency. Listings no bigger than one
+# chunk stay on the calling thread, where a local stat is cheaper than a hop.
+_STAT_WORKERS = 16
+_STAT_CHUNK_SIZE = 32
+_stat_executor: Optional[ThreadPoolExecutor] = None
+_stat_executor_lock = threading.Lock()
+
+
+def _get_stat_executor() -> ThreadPoolExecutor:
+    global _stat_executor
+    if _stat_executor is None:
+        with _stat_executor_lock:
+            if _stat_executor is None:
+                _stat_executor = ThreadPoolExecutor(
+                    max_workers=_STAT_WORKERS, thread_name_prefix="filestore-stat")
+    return _stat_executor
+
+
+@lru_cache(maxsize=4096)
+def _uid_to_name(uid: int) -> str:
+    """Resolve a uid to a user name, falling back to the number itself."""
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except (KeyError, AttributeError):
+        return str(uid)
+
+
+@lru_cache(maxsize=4096)
+def _gid_to_name(gid: int) -> str:
+    """Resolve a gid to a group name, falling back to the number itself."""
+    try:
+        return grp.getgrgid(gid).gr_name
+    except (KeyError, AttributeError):
+        return str(gid)
+
+
+def _advise_read(file_handle, offset: int, length: int, sequential: bool = False):
+    """Hint the kernel about an upcoming read so it can start readahead early.
+
+    Whole-file streams are marked sequential (larger readahead window); byte
+    ranges are prefetched in bounded windows by _read_range.
+
+    No-op where posix_fadvise is unavailable (macOS, Windows) or the handle
+    has no real file descriptor.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    advice = os.POSIX_FADV_SEQUENTIAL if sequential else os.POSIX_FADV_WILLNEED
+    try:
+        os.posix_fadvise(file_handle.fileno(), offset, length, advice)
+    except (AttributeError, OSError, ValueError):
+        pass
+
+
+def _read_chunks(file_handle, buffer_size: int) -> Generator[bytes, None, None]:
+    """Read a file handle to EOF, doubling the read size while reads come back full.
+
+    The first chunk stays small so the response starts quickly; long
+    sequential downloads then settle at MAX_STREAM_BUFFER_SIZE per read.
+    """
+    size = buffer_size
+    while True:
+        chunk = file_handle.read(size)
+        if not chunk:
+            break
+        yield chunk
+        if len(chunk) == size and size < MAX_STREAM_BUFFER_SIZE:
+            size = min(size * 2, MAX_STREAM_BUFFER_SIZE)
 
-# Default buffer size for streaming file contents
-DEFAULT_BUFFER_SIZE = 8192
+
+def _read_range(file_handle, start: int, length: int, buffer_size: int) -> Generator[bytes, None, None]:
+    """Read length bytes from start, prefetching at most _READAHEAD_WINDOW ahead.
+
+    The prefetch is extended whenever less than half a window remains
+    ahead of the read position.
+    """
+    if length <= 0:
+        # posix_fadvise reads a zero length as "to end of file"
+        return
+    end = start + length
+    advised = min(end, start + _READAHEAD_WINDOW)
+    _advise_read(file_handle, start, advised - start)
+    file_handle.seek(start)
+    pos = start
+    while pos < end:
+        chunk = file_handle.read(min(buffer_size, end - pos))
+        if not chunk:
+            break
+        yield chunk
+        pos += len(chunk)
+        if advised < end and advised - pos < _READAHEAD_WINDOW // 2:
+            next_advised = min(end, pos + _READAHEAD_WINDOW)
+            _advise_read(file_handle, advised, next_advised - advised)
+            advised = next_advised
 
 
 class RootCheckError(ValueError):
@@ -54,7 +174,8 @@ class FileInfo(BaseModel):
     symlink_target_fsp: Optional[dict] = None  # {"fsp_name": str, "subpath": str}
 
     @staticmethod
-    def _safe_readlink(path: str, root_path: Optional[str] = None) -> Optional[str]:
+    def _safe_readlink(path: str, root_path: Optional[str] = None,
+                       parent_real: Optional[str] = None) -> Optional[str]:
         """
         Safely read a symlink target.
 
@@ -64,13 +185,18 @@ class FileInfo(BaseModel):
         the parent directory (not realpath of the symlink itself) because
         realpath would resolve the symlink to its target, which may legitimately
         be outside root for cross-share symlinks.
+
+        root_path must already be canonical (Filestore.root_path is). Callers
+        that have already resolved the symlink's parent directory can pass it
+        as parent_real to skip resolving it again.
         """
         try:
             if root_path is not None:
-                root_real = os.path.realpath(root_path)
+                root_real = root_path
                 # Check the symlink's parent directory is within root
                 # (don't resolve the symlink itself - that would check the target)
-                parent_real = os.path.realpath(os.path.dirname(path))
+                if parent_real is None:
+                    parent_real = os.path.realpath(os.path.dirname(path))
                 if not (parent_real == root_real or parent_real.startswith(root_real + os.sep)):
                     logger.warning(f"Refusing to read symlink outside root: {path}")
                     return None
@@ -86,7 +212,8 @@ class FileInfo(BaseModel):
 
     @classmethod
     def _get_symlink_target_fsp(cls, absolute_path: str, is_symlink: bool,
-                                fsps: Optional[list], root_path: Optional[str]) -> Optional[dict]:
+                                fsps: Optional[list], root_path: Optional[str],
+                                parent_real: Optional[str] = None) -> Optional[dict]:
         """
         Resolve a symlink target to a file share path.
 
@@ -97,7 +224,8 @@ class FileInfo(BaseModel):
             return None
 
         # Read the symlink target safely
-        target = cls._safe_readlink(absolute_path, root_path=root_path)
+        target = cls._safe_readlink(absolute_path, root_path=root_path,
+                                    parent_real=parent_real)
         if target is None:
             return None
 
@@ -136,7 +264,8 @@ class FileInfo(BaseModel):
                   lstat_result: os.stat_result, stat_result: os.stat_result,
                   current_user: str = None, fsps: Optional[list] = None,
                   root_path: Optional[str] = None,
-                  user_groups: Optional[set[str]] = None):
+                  user_groups: Optional[set[str]] = None,
+                  parent_real: Optional[str] = None):
         """
         Create FileInfo from pre-computed stat results.
 
@@ -148,7 +277,9 @@ class FileInfo(BaseModel):
             current_user: Username for permission checking (optional).
             fsps: List of FileSharePath objects for symlink target resolution (optional).
             root_path: Filestore root for defense-in-depth validation in symlink reading (optional).
-            user_groups: Pre-computed user group set to avoid per-file getgrall() (optional).
+            user_groups: Pre-computed user group set to avoid per-file group lookups (optional).
+            parent_real: Already-resolved parent directory of absolute_path, reused
+                when validating symlinks (optional).
         """
         if path is None or path == "":
             raise ValueError("Path cannot be None or empty")
@@ -161,15 +292,10 @@ class FileInfo(BaseModel):
         permissions = stat.filemode(stat_result.st_mode)
         last_modified = stat_result.st_mtime
 
-        try:
-            owner = pwd.getpwuid(stat_result.st_uid).pw_name
-        except (KeyError, AttributeError):
-            owner = str(stat_result.st_uid)
-
-        try:
-            group = grp.getgrgid(stat_result.st_gid).gr_name
-        except (KeyError, AttributeError):
-            group = str(stat_result.st_gid)
+        # Most entries in a share are owned by a handful of users, so the
+        # name lookups are memoized by id.
+        owner = _uid_to_name(stat_result.st_uid)
+        group = _gid_to_name(stat_result.st_gid)
 
         # Calculate read/write permissions for current user
         hasRead = None
@@ -178,7 +304,8 @@ class FileInfo(BaseModel):
             hasRead, hasWrite = cls._check_permissions(stat_result, current_user, owner, group, user_groups)
 
         # Resolve symlink target to file share path if applicable
-        symlink_target_fsp = cls._get_symlink_target_fsp(absolute_path, is_symlink, fsps, root_path)
+        symlink_target_fsp = cls._get_symlink_target_fsp(absolute_path, is_symlink, fsps,
+                                                         root_path, parent_real)
 
         return cls(
             name=name,
@@ -198,20 +325,31 @@ class FileInfo(BaseModel):
 
     @staticmethod
     def _get_user_groups(username: str) -> set[str]:
-        """Compute all groups a user belongs to. Call once per listing, not per file."""
-        groups: set[str] = set()
-        try:
-            for g in grp.getgrall():
-                if username in g.gr_mem:
-                    groups.add(g.gr_name)
-        except (KeyError, OSError, AttributeError):
-            pass
+        """Compute all groups a user belongs to. Call once per listing, not per file.
+
+        Uses os.getgrouplist, which asks NSS only for this user's memberships,
+        instead of enumerating every group on the system with grp.getgrall
+        (thousands of entries on LDAP/AD-joined hosts).
+        """
         try:
             primary_gid = pwd.getpwnam(username).pw_gid
-            primary_group = grp.getgrgid(primary_gid).gr_name
-            groups.add(primary_group)
-        except (KeyError, OSError, AttributeError):
-            pass
+        except (KeyError, AttributeError):
+            return set()
+        try:
+            gids = os.getgrouplist(username, primary_gid)
+        except (OSError, AttributeError):
+            gids = [primary_gid]
+        return {_gid_to_name(gid) for gid in gids}
+
+    @staticmethod
+    def _get_cached_user_groups(username: str) -> frozenset[str]:
+        """Like _get_user_groups, but reuses the result for a few minutes."""
+        with _user_groups_lock:
+            groups = _user_groups_cache.get(username)
+        if groups is None:
+            groups = frozenset(FileInfo._get_user_groups(username))
+            with _user_groups_lock:
+                _user_groups_cache[username] = groups
         return groups
 
     @staticmethod
@@ -222,7 +360,7 @@ class FileInfo(BaseModel):
 
         Args:
             user_groups: Pre-computed set of group names the user belongs to.
-                When provided, avoids the expensive grp.getgrall() call.
+                When provided, avoids looking up the group memberships again.
         """
         mode = stat_result.st_mode
 
@@ -230,7 +368,7 @@ class FileInfo(BaseModel):
             return bool(mode & stat.S_IRUSR), bool(mode & stat.S_IWUSR)
 
         if user_groups is None:
-            user_groups = FileInfo._get_user_groups(current_user)
+            user_groups = FileInfo._get_cached_user_groups(current_user)
 
         if group in user_groups:
             return bool(mode & stat.S_IRGRP), bool(mode & stat.S_IWGRP)
@@ -253,6 +391,9 @@ class Filestore:
         expanded_path = os.path.expanduser(file_share_path.mount_path)
         # Use realpath to resolve symlinks for consistent path operations (e.g., /var -> /private/var on macOS)
         self.root_path = os.path.realpath(expanded_path)
+        # root_path is already canonical; keep the separator-suffixed prefix
+        # around so per-entry containment checks don't rebuild it.
+        self._root_prefix = self.root_path + os.sep
 
 
     def _check_path_in_root(self, path: Optional[str]) -> str:
@@ -273,10 +414,10 @@ class Filestore:
         else:
             # Resolve symlinks and normalize the path
             full_path = os.path.realpath(os.path.join(self.root_path, path))
-            root_real = os.path.realpath(self.root_path)
+            root_real = self.root_path
 
             # Ensure the resolved path is within the resolved root
-            if not full_path.startswith(root_real + os.sep) and full_path != root_real:
+            if not full_path.startswith(self._root_prefix) and full_path != root_real:
                 raise RootCheckError(f"Path ({full_path}) attempts to escape root directory ({root_real})", full_path)
         return full_path
 
@@ -301,7 +442,7 @@ class Filestore:
         method, which allows static analysis tools (CodeQL) to see that the
         path is sanitized before use.
         """
-        root_real = os.path.realpath(self.root_path)
+        root_real = self.root_path
 
         # Defense-in-depth: normalize full_path with abspath (resolves ".."
         # without following symlinks) and verify it is within root before any
@@ -310,7 +451,7 @@ class Filestore:
         full_path = os.path.abspath(full_path)
 
         def _is_within_root(p: str) -> bool:
-            return p == root_real or p.startswith(root_real + os.sep)
+            return p == root_real or p.startswith(self._root_prefix)
 
         # Check the normalized path string is under root (catches .. traversal)
         if not _is_within_root(full_path):
@@ -322,6 +463,7 @@ class Filestore:
         # Check the resolved parent is under root (catches symlink-based traversal
         # e.g. /root/data/symlink_to_etc/passwd where symlink_to_etc -> /etc)
         # Skip when full_path is the root itself, since root's parent is above root.
+        parent_real = None
         if full_path != root_real:
             parent_real = os.path.realpath(os.path.dirname(full_path))
             if not _is_within_root(parent_real):
@@ -354,29 +496,33 @@ class Filestore:
                 logger.warning(f"Broken symlink detected: {full_path}: {e}")
                 stat_result = lstat_result
         else:
-            stat_result = os.stat(full_path)
+            # stat() and lstat() agree for anything that isn't a symlink
+            stat_result = lstat_result
 
         return FileInfo.from_stat(
             rel_path, full_path, lstat_result, stat_result,
             current_user=current_user, fsps=fsps,
             root_path=self.root_path,
             user_groups=user_groups,
+            parent_real=parent_real,
         )
 
 
     def _file_info_from_direntry(self, entry: os.DirEntry, current_user: str = None,
                                     fsps: Optional[list] = None,
-                                    user_groups: Optional[set[str]] = None) -> FileInfo:
+                                    user_groups: Optional[set[str]] = None,
+                                    parent_real: Optional[str] = None) -> FileInfo:
         """Build a FileInfo from a DirEntry, using entry.stat() instead of os.lstat/os.stat.
 
         DirEntry.stat(follow_symlinks=False) uses fstatat() with the directory fd
         still open, which is significantly faster than os.lstat() on a full path.
 
-        This method is only called from yield_file_infos_paginated where the
+        This method is only called from the directory listings, where the
         parent directory was already validated by _check_path_in_root, so entries
-        from os.scandir() are guaranteed to be within root.
+        from os.scandir() are guaranteed to be within root. Listings pass that
+        resolved directory as parent_real so it isn't re-resolved per entry.
         """
-        root_real = os.path.realpath(self.root_path)
+        root_real = self.root_path
         full_path = entry.path
 
         lstat_result = entry.stat(follow_symlinks=False)
@@ -396,10 +542,15 @@ class Filestore:
         # (possibly nonexistent) target; on Windows an absolute target like
         # "/nonexistent/path" resolves onto another drive and os.path.relpath
         # then raises ValueError ("path is on mount 'D:', start on mount 'C:'").
-        parent_real = os.path.realpath(os.path.dirname(full_path))
+        if parent_real is None:
+            parent_real = os.path.realpath(os.path.dirname(full_path))
         full_real = os.path.join(parent_real, entry.name)
         if full_real == root_real:
             rel_path = '.'
+        elif full_real.startswith(self._root_prefix):
+            # Already canonical and under root, so the relative path is just
+            # the suffix; os.path.relpath would re-normalize both strings.
+            rel_path = full_real[len(self._root_prefix):]
         else:
             rel_path = os.path.relpath(full_real, root_real)
 
@@ -408,6 +559,7 @@ class Filestore:
             current_user=current_user, fsps=fsps,
             root_path=self.root_path,
             user_groups=user_groups,
+            parent_real=parent_real,
         )
 
     def get_root_path(self) -> str:
@@ -489,22 +641,33 @@ class Filestore:
             FileNotFoundError: If the file does not exist
             PermissionError: If the file cannot be read
         """
-        from .utils import is_likely_binary
-
         full_path = self._check_path_in_root(path)
 
-        # Directories are not binary
-        if os.path.isdir(full_path):
+        # Read the sample with a raw fd (no io buffering for a 4 KiB read) and
+        # answer the directory question from fstat on it, instead of a separate
+        # stat of the path before opening.
+        try:
+            fd = os.open(full_path, os.O_RDONLY)
+        except IsADirectoryError:
             return False
+        except Exception as e:
+            # Windows refuses to open directories with a PermissionError
+            if os.path.isdir(full_path):
+                return False
+            # If we can't read the file, assume it's binary to be safe
+            logger.warning(f"Could not read file sample for binary detection: {e}")
+            return True
 
         try:
-            with open(full_path, 'rb') as f:
-                sample = f.read(sample_size)
-                return is_likely_binary(sample)
+            # Directories are not binary
+            if stat.S_ISDIR(os.fstat(fd).st_mode):
+                return False
+            return is_likely_binary(os.read(fd, sample_size))
         except Exception as e:
-            # If we can't read the file, assume it's binary to be safe
             logger.warning(f"Could not read file sample for binary detection: {e}")
             return True
+        finally:
+            os.close(fd)
 
 
     def yield_file_infos_paginated(self, path: Optional[str] = None, current_user: str = None,
@@ -540,7 +703,7 @@ class Filestore:
         full_path = self._check_path_in_root(path)
 
         # Compute user groups once for the entire listing
-        user_groups = FileInfo._get_user_groups(current_user) if current_user else None
+        user_groups = FileInfo._get_cached_user_groups(current_user) if current_user else None
 
         # Read max_count + 1 entries: the extra one detects truncation without
         # reading the entire directory.
@@ -571,15 +734,8 @@ class Filestore:
         page_entries = entries[:limit]
 
         # Build FileInfo using DirEntry.stat() (faster than os.lstat on full path)
-        file_infos = []
-        for entry in page_entries:
-            try:
-                file_infos.append(
-                    self._file_info_from_direntry(entry, current_user, fsps, user_groups)
-                )
-            except PermissionError as e:
-                logger.error(f"Permission denied accessing entry: {entry.path}: {e}")
-                continue
+        file_infos = list(self._file_infos_from_direntries(
+            page_entries, current_user, fsps, user_groups, parent_real=full_path))
 
         next_cursor = page_entries[-1].name if has_more and page_entries else None
         return file_infos, has_more, next_cursor, total_count, is_truncated
@@ -604,19 +760,44 @@ class Filestore:
         full_path = self._check_path_in_root(path)
 
         # Compute user groups once for the entire listing
-        user_groups = FileInfo._get_user_groups(current_user) if current_user else None
+        user_groups = FileInfo._get_cached_user_groups(current_user) if current_user else None
 
-        entries = list(os.scandir(full_path))
+        with os.scandir(full_path) as scanner:
+            entries = list(scanner)
         # Sort entries in alphabetical order, with directories listed first
         # DirEntry.is_dir() is free on Linux (cached from readdir)
         entries.sort(key=lambda e: (not e.is_dir(follow_symlinks=False), e.name))
-        for entry in entries:
-            try:
-                yield self._file_info_from_direntry(entry, current_user, fsps, user_groups)
-            except PermissionError as e:
-                # Skip files we don't have permission to access
-                logger.error(f"Permission denied accessing entry: {entry.path}: {e}")
-                continue
+        yield from self._file_infos_from_direntries(
+            entries, current_user, fsps, user_groups, parent_real=full_path)
+
+    def _file_infos_from_direntries(self, entries: list[os.DirEntry], current_user: str,
+                                    fsps: Optional[list], user_groups: Optional[set[str]],
+                                    parent_real: str) -> Generator[FileInfo, None, None]:
+        """Build FileInfo objects for sorted entries, preserving their order.
+
+        Entries are processed in chunks on the shared stat pool so that
+        metadata round trips overlap on network file systems. Entries we are
+        not permitted to stat are logged and skipped.
+        """
+        def build(chunk: list[os.DirEntry]) -> list[FileInfo]:
+            infos = []
+            for entry in chunk:
+                try:
+                    infos.append(self._file_info_from_direntry(
+                        entry, current_user, fsps, user_groups, parent_real=parent_real))
+                except PermissionError as e:
+                    # Skip files we don't have permission to access
+                    logger.error(f"Permission denied accessing entry: {entry.path}: {e}")
+            return infos
+
+        if len(entries) <= _STAT_CHUNK_SIZE:
+            yield from build(entries)
+            return
+
+        chunks = [entries[i:i + _STAT_CHUNK_SIZE]
+                  for i in range(0, len(entries), _STAT_CHUNK_SIZE)]
+        for infos in _get_stat_executor().map(build, chunks):
+            yield from infos
 
 
     def stream_file_contents(self, path: str = None, buffer_size: int = DEFAULT_BUFFER_SIZE, file_handle = None) -> Generator[bytes, None, None]:
@@ -625,8 +806,9 @@ class Filestore:
 
         Args:
             path (str): The path to the file to stream (optional if file_handle is provided).
-            buffer_size (int): The size of the buffer to use when reading the file.
-                Defaults to DEFAULT_BUFFER_SIZE, which is 8192 bytes.
+            buffer_size (int): The size of the first read from the file; later reads
+                grow up to MAX_STREAM_BUFFER_SIZE. Defaults to DEFAULT_BUFFER_SIZE,
+                which is 256 KiB.
             file_handle: An open file handle to stream from (optional, takes precedence over path).
                 The handle will be closed when streaming completes.
 
@@ -635,12 +817,9 @@ class Filestore:
         """
         if file_handle is not None:
             # Stream from the provided file handle and ensure it gets closed
+            _advise_read(file_handle, 0, 0, sequential=True)
             try:
-                while True:
-                    chunk = file_handle.read(buffer_size)
-                    if not chunk:
-                        break
-                    yield chunk
+                yield from _read_chunks(file_handle, buffer_size)
             finally:
                 file_handle.close()
         else:
@@ -649,11 +828,8 @@ class Filestore:
                 raise ValueError("Path cannot be None or empty")
             full_path = self._check_path_in_root(path)
             with open(full_path, 'rb') as file:
-                while True:
-                    chunk = file.read(buffer_size)
-                    if not chunk:
-                        break
-                    yield chunk
+                _advise_read(file, 0, 0, sequential=True)
+                yield from _read_chunks(file, buffer_size)
 
     def stream_file_range(self, path: str = None, start: int = 0, end: int = 0, buffer_size: int = DEFAULT_BUFFER_SIZE, file_handle = None) -> Generator[bytes, None, None]:
         """
@@ -687,16 +863,7 @@ class Filestore:
 
         # Stream from the file handle
         try:
-            file_handle.seek(start)
-            remaining = end - start + 1
-
-            while remaining > 0:
-                chunk_size = min(buffer_size, remaining)
-                chunk = file_handle.read(chunk_size)
-                if not chunk:
-                    break
-                yield chunk
-                remaining -= len(chunk)
+            yield from _read_range(file_handle, start, end - start + 1, buffer_size)
         finally:
             if should_close_handle:
                 file_handle.close()
@@ -705,12 +872,9 @@ class Filestore:
     @staticmethod
     def _stream_contents(file_handle, buffer_size: int = DEFAULT_BUFFER_SIZE) -> Generator[bytes, None, None]:
         """Stream from an open file handle. Handle is closed when done."""
+        _advise_read(file_handle, 0, 0, sequential=True)
         try:
-            while True:
-                chunk = file_handle.read(buffer_size)
-                if not chunk:
-                    break
-                yield chunk
+            yield from _read_chunks(file_handle, buffer_size)
         finally:
             file_handle.close()
 
@@ -719,15 +883,7 @@ class Filestore:
                       file_handle, buffer_size: int = DEFAULT_BUFFER_SIZE) -> Generator[bytes, None, None]:
         """Stream a byte range from an open file handle. Handle is closed when done."""
         try:
-            file_handle.seek(start)
-            remaining = content_length
-            while remaining > 0:
-                chunk_size = min(buffer_size, remaining)
-                chunk = file_handle.read(chunk_size)
-                if not chunk:
-                    break
-                yield chunk
-                remaining -= len(chunk)
+            yield from _read_range(file_handle, start, content_length, buffer_size)
         finally:
             file_handle.close()
 
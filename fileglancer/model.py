@@ -1,8 +1,9 @@
 import re
 from datetime import datetime
+from functools import cached_property
 from typing import Annotated, Any, List, Literal, Optional, Dict, Union
 
-from pydantic import BaseModel, Discriminator, Field, HttpUrl, Tag, field_validator, model_validator
+from pydantic import BaseModel, Discriminator, Field, HttpUrl, PrivateAttr, Tag, field_validator, model_validator
 
 
 class FileSharePath(BaseModel):
@@ -341,6 +342,11 @@ class AppParameter(BaseModel):
     hidden: bool = Field(description="Whether the parameter is hidden by default in the UI", default=False)
     raw: bool = Field(description="If true, value is appended to the command without shell quoting", default=False)
 
+    # Validated string form of `default`, filled in lazily by build_command.
+    # Only used for types whose validation doesn't depend on the submitting
+    # user (i.e. not file/directory).
+    _validated_default: Optional[str] = PrivateAttr(default=None)
+
     @field_validator("flag")
     @classmethod
     def validate_flag(cls, v):
@@ -612,6 +618,11 @@ class AppManifest(BaseModel):
     def validate_requirements(cls, v):
         return _validate_requirements(v)
 
+    @cached_property
+    def runnables_by_id(self) -> Dict[str, AppEntryPoint]:
+        """Map each entry point id to its entry point, built once per manifest."""
+        return {ep.id: ep for ep in self.runnables}
+
 
 class UserApp(BaseModel):
     """A user's saved app reference"""
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import re
 import sys
@@ -10,7 +11,7 @@ except ImportError:
 import json
 import secrets
 from datetime import datetime, timedelta, timezone, UTC
-from functools import cache
+from functools import cache, lru_cache
 from pathlib import Path as PathLib
 from typing import List, Optional, Dict, Tuple, Generator
 
@@ -166,6 +167,25 @@ def _read_version() -> str:
 APP_VERSION = _read_version()
 
 
+@lru_cache(maxsize=4)
+def _load_notifications_cached(path: str, mtime_ns: int, size: int) -> dict:
+    # mtime_ns and size are only part of the cache key, so edits to the file
+    # are picked up on the next request.
+    with open(path, "r") as f:
+        return yaml.safe_load(f) or {}
+
+
+def _load_notifications(path: str) -> dict:
+    """Parse notifications.yaml, reusing the result while the file is unchanged.
+
+    The frontend polls for notifications, and the handler runs on the event
+    loop, so only a stat is paid per poll rather than a blocking YAML parse.
+    The returned dict is shared between callers and must not be mutated.
+    """
+    st = os.stat(path)
+    return _load_notifications_cached(path, st.st_mtime_ns, st.st_size)
+
+
 def get_current_user(request: Request):
     """
     FastAPI dependency to get the current authenticated user
@@ -341,7 +361,10 @@ def create_app(settings):
         process's user — useful for debugging the worker code path locally.
 
         In CLI mode (settings.cli_mode=True) the action runs directly in the
-        current process, since CLI is single-user.
+        current process, since CLI is single-user. The handler runs on a
+        thread so its blocking file I/O (e.g. reading a large job log off
+        NFS) doesn't stall the event loop, mirroring how the worker pool does
+        its socket I/O in an executor.
 
         If the worker opens a file and passes back a file descriptor (e.g.
         open_file, s3_open_object), the response dict will contain a
@@ -370,7 +393,7 @@ def create_app(settings):
             ctx = WorkerContext(username=username, db=LocalDbProxy(settings.db_url))
             request = {"action": action, **kwargs}
             try:
-                result = handler(request, ctx)
+                result = await asyncio.to_thread(handler, request, ctx)
             except Exception as e:
                 logger.exception(f"Action handler error for {username} action={action}: {e}")
                 raise HTTPException(status_code=500, detail=str(e))
@@ -828,8 +851,7 @@ def create_app(settings):
             # Read notifications from YAML file in current working directory
             notifications_file = os.path.join(os.getcwd(), "notifications.yaml")
 
-            with open(notifications_file, "r") as f:
-                data = yaml.safe_load(f)
+            data = _load_notifications(notifications_file)
 
             notifications = []
             current_time = datetime.now(timezone.utc)
@@ -1374,9 +1396,11 @@ def create_app(settings):
 
     # Profile endpoint
     @app.get("/api/profile", description="Get the current user's profile")
-    async def get_profile(username: str = Depends(get_current_user)):
+    async def get_profile(fields: Optional[str] = Query(None, description="Comma-separated list of profile fields to return (username, homeFileSharePathName, homeDirectoryName, groups). Defaults to all fields."),
+                          username: str = Depends(get_current_user)):
         """Get the current user's profile"""
-        result = await _worker_exec(username, "get_profile")
+        field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+        result = await _worker_exec(username, "get_profile", fields=field_list)
         return result
 
     # SSH Key Management endpoints
@@ -1439,7 +1463,7 @@ def create_app(settings):
             raise HTTPException(status_code=result.get("status_code", 500), detail=result["error"])
 
         info = result["info"]
-        file_name = subpath.split('/')[-1] if subpath else ''
+        file_name = subpath.rsplit('/', 1)[-1] if subpath else ''
         content_type = result["content_type"]
         is_binary = result["is_binary"]
 
@@ -1481,7 +1505,7 @@ def create_app(settings):
 
         file_size = result["file_size"]
         content_type = result["content_type"]
-        file_name = subpath.split('/')[-1] if subpath else ''
+        file_name = subpath.rsplit('/', 1)[-1] if subpath else ''
 
         range_header = request.headers.get('Range')
 
@@ -1564,7 +1588,12 @@ def create_app(settings):
             raise HTTPException(status_code=status_code, detail=result["error"])
         if "error" in result:
             raise HTTPException(status_code=500, detail=result["error"])
-        return result
+        # The list_dir actions build their result from model_dump(mode="json")
+        # plus plain scalars, so it is JSON-safe whether it came back over the
+        # worker socket or, in CLI mode, straight from the in-process handler.
+        # Returning it wrapped skips FastAPI's recursive jsonable_encoder pass,
+        # which is costly for large listings.
+        return JSONResponse(content=result)
 
 
     @app.post("/api/files/{path_name}")
@@ -2110,17 +2139,25 @@ def create_app(settings):
              description="Get job file content (script, stdout, or stderr)")
     async def get_job_file(job_id: int,
                            file_type: str = Path(..., description="File type: script, stdout, or stderr"),
+                           max_bytes: Optional[int] = Query(
+                               None, ge=1,
+                               description="Return only the last max_bytes bytes of the file. "
+                                           "The full size is reported in the X-File-Size header."),
                            username: str = Depends(get_current_user)):
         if file_type not in ("script", "stdout", "stderr"):
             raise HTTPException(status_code=400, detail="file_type must be script, stdout, or stderr")
         try:
-            result = await _worker_exec(username, "get_job_file", job_id=job_id, file_type=file_type)
+            result = await _worker_exec(username, "get_job_file", job_id=job_id,
+                                        file_type=file_type, max_bytes=max_bytes)
             if "error" in result:
                 raise HTTPException(status_code=result.get("status_code", 404), detail=result["error"])
             content = result.get("content")
             if content is None:
                 raise HTTPException(status_code=404, detail=f"File not found: {file_type}")
-            return PlainTextResponse(content)
+            headers = {}
+            if result.get("size") is not None:
+                headers["X-File-Size"] = str(result["size"])
+            return PlainTextResponse(content, headers=headers)
         except HTTPException:
             raise
         except Exception as e:
@@ -2278,13 +2315,14 @@ def create_app(settings):
             raise HTTPException(status_code=400, detail="Invalid file path")
 
         resolved_path = PathLib(resolved_dir)
-        # Serve logo.svg and other root-level static files from ui directory
-        if resolved_path.exists() and resolved_path.is_file():
+        # Serve logo.svg and other root-level static files from ui directory.
+        # is_file() is False for missing paths, so one stat() covers both checks.
+        if resolved_path.is_file():
             return FileResponse(resolved_path)
 
         # Otherwise serve index.html for SPA routing
         index_path = ui_dir / "index.html"
-        if index_path.exists():
+        if index_path.is_file():
             return FileResponse(index_path, media_type="text/html")
         raise HTTPException(status_code=404, detail="Not found")
 
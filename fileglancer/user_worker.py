@@ -263,34 +263,14 @@ def serialize_db_result(method: str, value):
 # unmount/remount mid-session.
 _filestore_cache: dict[str, Any] = {}
 
-# Per-username cache of supplementary group names. Keyed by username so the
-# in-process dev/test path (which serves multiple users from one process)
-# stays correct; in subprocess mode there's only ever one entry.
-_user_groups_cache: dict[str, list[str]] = {}
-
-
 def _get_user_groups(username: str) -> list[str]:
-    """Return the supplementary group names for a user.
+    """Return the group names for a user, sorted.
 
-    Uses os.getgrouplist (NSS initgroups) instead of grp.getgrall, which
-    enumerates every group on the system and is very slow on LDAP/NIS hosts.
-    Result is cached for the lifetime of the process.
+    Shares FileInfo's cached getgrouplist lookup, so the profile reports the
+    same memberships the permission checks in listings use.
     """
-    cached = _user_groups_cache.get(username)
-    if cached is not None:
-        return cached
-
-    import grp as _grp
-    pw = pwd.getpwnam(username)
-    gids = os.getgrouplist(username, pw.pw_gid)
-    names = []
-    for gid in gids:
-        try:
-            names.append(_grp.getgrgid(gid).gr_name)
-        except KeyError:
-            continue
-    _user_groups_cache[username] = names
-    return names
+    from fileglancer.filestore import FileInfo
+    return sorted(FileInfo._get_cached_user_groups(username))
 
 
 def _get_filestore(fsp_name: str, fsps: list):
@@ -487,7 +467,7 @@ def _action_open_file(request: dict, ctx: WorkerContext, filestore, fsps) -> dic
         if file_info.is_dir:
             return {"error": "Cannot download directory content", "status_code": 400}
 
-        file_name = subpath.split('/')[-1] if subpath else ''
+        file_name = subpath.rsplit('/', 1)[-1] if subpath else ''
         content_type = guess_content_type(file_name)
         full_path = filestore._check_path_in_root(subpath)
 
@@ -520,7 +500,7 @@ def _action_head_file(request: dict, ctx: WorkerContext, filestore, fsps) -> dic
 
     try:
         file_info = filestore.get_file_info(subpath, current_user=ctx.username)
-        file_name = subpath.split('/')[-1] if subpath else ''
+        file_name = subpath.rsplit('/', 1)[-1] if subpath else ''
         content_type = guess_content_type(file_name)
         is_binary = filestore.check_is_binary(subpath) if not file_info.is_dir else False
 
@@ -657,33 +637,46 @@ def _action_validate_paths(request: dict, ctx: WorkerContext) -> dict:
 
 @action("get_profile")
 def _action_get_profile(request: dict, ctx: WorkerContext) -> dict:
-    """Get user profile information."""
-    username = ctx.username
-    paths = ctx.db.get_file_share_paths()
-
-    home_fsp = next((fsp for fsp in paths if fsp.mount_path in ('~', '~/')), None)
-    if home_fsp:
-        home_directory_name = "."
-    else:
-        home_directory_path = os.path.expanduser(f"~{username}")
-        home_parent = os.path.dirname(home_directory_path)
-        home_fsp = next((fsp for fsp in paths if fsp.mount_path == home_parent), None)
-        home_directory_name = os.path.basename(home_directory_path)
+    """Get user profile information.
 
-    home_fsp_name = home_fsp.name if home_fsp else None
-
-    user_groups = []
-    try:
-        user_groups = _get_user_groups(username)
-    except Exception as e:
-        logger.error(f"Error getting groups for user {username}: {e}")
+    If request["fields"] is given, only those profile fields are computed
+    and returned; the home share lookup and group enumeration are skipped
+    when none of their fields are asked for.
+    """
+    username = ctx.username
+    fields = request.get("fields")
+    wanted = set(fields) if fields else None
+    result: dict = {}
+
+    if wanted is None or "username" in wanted:
+        result["username"] = username
+
+    if wanted is None or wanted & {"homeFileSharePathName", "homeDirectoryName"}:
+        paths = ctx.db.get_file_share_paths()
+
+        home_fsp = next((fsp for fsp in paths if fsp.mount_path in ('~', '~/')), None)
+        if home_fsp:
+            home_directory_name = "."
+        else:
+            home_directory_path = os.path.expanduser(f"~{username}")
+            home_parent = os.path.dirname(home_directory_path)
+            home_fsp = next((fsp for fsp in paths if fsp.mount_path == home_parent), None)
+            home_directory_name = os.path.basename(home_directory_path)
+
+        if wanted is None or "homeFileSharePathName" in wanted:
+            result["homeFileSharePathName"] = home_fsp.name if home_fsp else None
+        if wanted is None or "homeDirectoryName" in wanted:
+            result["homeDirectoryName"] = home_directory_name
+
+    if wanted is None or "groups" in wanted:
+        user_groups = []
+        try:
+            user_groups = _get_user_groups(username)
+        except Exception as e:
+            logger.error(f"Error getting groups for user {username}: {e}")
+        result["groups"] = user_groups
 
-    return {
-        "username": username,
-        "homeFileSharePathName": home_fsp_name,
-        "homeDirectoryName": home_directory_name,
-        "groups": user_groups,
-    }
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -726,15 +719,27 @@ def _action_generate_ssh_key(request: dict, ctx: WorkerContext) -> dict:
 
 @action("get_job_file")
 def _action_get_job_file(request: dict, ctx: WorkerContext) -> dict:
-    """Read job file content (script, stdout, stderr)."""
-    from fileglancer.apps.jobfiles import read_job_file
+    """Read job file content (script, stdout, stderr).
+
+    If request["max_bytes"] is set, only the tail of the file is returned,
+    along with the file's full size.
+    """
+    from fileglancer.apps.jobfiles import read_job_file, read_job_file_tail
     job_id = request["job_id"]
     file_type = request["file_type"]
+    max_bytes = request.get("max_bytes")
 
     db_job = ctx.db.get_job(job_id, ctx.username)
     if db_job is None:
         return {"error": f"Job {job_id} not found", "status_code": 404}
 
+    if max_bytes is not None:
+        tail = read_job_file_tail(db_job, file_type, max_bytes)
+        if tail is None:
+            return {"content": None}
+        content, size = tail
+        return {"content": content, "size": size}
+
     content = read_job_file(db_job, file_type)
     if content is None:
         return {"content": None}
@@ -969,7 +974,13 @@ def _action_cancel(request: dict, ctx: WorkerContext) -> dict:
 
 @action("poll")
 def _action_poll(request: dict, ctx: WorkerContext) -> dict:
-    """Poll job statuses via py-cluster-api."""
+    """Poll job statuses via py-cluster-api.
+
+    Only jobs whose status differs from the one the parent passed in
+    request["job_statuses"] are returned, so the response (and the parent's
+    update pass) scales with the number of transitions rather than the
+    number of active jobs.
+    """
     from cluster_api import JobStatus
 
     executor = _get_executor(request)
@@ -987,6 +998,9 @@ def _action_poll(request: dict, ctx: WorkerContext) -> dict:
 
     jobs = {}
     for cid, record in executor.jobs.items():
+        known = known_statuses.get(cid)
+        if known is not None and record.status.value == known.lower():
+            continue
         jobs[cid] = {
             "status": record.status.value,
             "exit_code": record.exit_code,
@@ -1,5 +1,6 @@
 import re
 from datetime import datetime, timezone
+from functools import lru_cache
 from mimetypes import guess_type
 
 def slugify_path(s):
@@ -21,8 +22,14 @@ def format_timestamp(timestamp):
     return dt.isoformat()
 
 
+@lru_cache(maxsize=4096)
 def guess_content_type(filename):
-    """A wrapper for guess_type which deals with unknown MIME types"""
+    """A wrapper for guess_type which deals with unknown MIME types.
+
+    Memoized on the full name (not just the extension, so compound suffixes
+    like .tar.gz resolve as before); names such as zarr chunk keys and
+    metadata files repeat heavily across requests.
+    """
     content_type, _ = guess_type(filename)
     if content_type:
         return content_type
@@ -61,40 +68,34 @@ def is_likely_binary(data: bytes) -> bool:
     return control_count / len(data) >= 0.01
 
 
+# Only the first range of a multi-range request is honoured.
+_RANGE_RE = re.compile(r'bytes=\s*(\d*)\s*-\s*(\d*)\s*(?:,|$)')
+
+
 def parse_range_header(range_header: str, file_size: int):
     """Parse HTTP Range header and return start and end byte positions."""
-    if not range_header or not range_header.startswith('bytes='):
+    if not range_header:
         return None
 
-    try:
-        range_spec = range_header[6:]  # Remove 'bytes=' prefix
-
-        if ',' in range_spec:
-            range_spec = range_spec.split(',')[0].strip()
-
-        if '-' not in range_spec:
-            return None
-
-        start_str, end_str = range_spec.split('-', 1)
-
-        if start_str and end_str:
-            start = int(start_str)
-            end = int(end_str)
-        elif start_str and not end_str:
-            start = int(start_str)
-            end = file_size - 1
-        elif not start_str and end_str:
-            suffix_length = int(end_str)
-            start = max(0, file_size - suffix_length)
-            end = file_size - 1
-        else:
-            return None
+    m = _RANGE_RE.match(range_header)
+    if m is None:
+        return None
 
-        if start < 0 or end < 0 or start >= file_size or start > end:
-            return None
+    start_str, end_str = m.groups()
+    if start_str and end_str:
+        start = int(start_str)
+        end = int(end_str)
+    elif start_str:
+        start = int(start_str)
+        end = file_size - 1
+    elif end_str:
+        start = max(0, file_size - int(end_str))
+        end = file_size - 1
+    else:
+        return None
 
-        end = min(end, file_size - 1)
-        return (start, end)
+    if start >= file_size or start > end:
+        return None
 
-    except (ValueError, IndexError):
-        return None
\ No newline at end of file
+    end = min(end, file_size - 1)
+    return (start, end)
@@ -61,6 +61,15 @@ class WorkerDead(Exception):
     pass
 
 
+def _log_worker_line(username: str, line: bytes):
+    """Log one line of worker stderr, decoding only if debug is enabled."""
+    logger.opt(lazy=True).debug(
+        "[worker:{}] {}",
+        lambda: username,
+        lambda: line.decode(errors="replace").rstrip(),
+    )
+
+
 class UserWorker:
     """Wraps a single persistent worker subprocess for one user.
 
@@ -395,14 +404,26 @@ class WorkerPool:
         If this task dies, the worker's stderr pipe will eventually fill and
         block the worker on its next write — so failures here are logged
         loudly rather than swallowed.
+
+        Reads the pipe in chunks so a chatty worker costs one executor hop per
+        chunk rather than per line, and defers decoding to loguru so nothing
+        is decoded when debug logging is filtered out.
         """
         try:
             loop = asyncio.get_event_loop()
+            fd = process.stderr.fileno()
+            buf = bytearray()
             while True:
-                line = await loop.run_in_executor(None, process.stderr.readline)
-                if not line:
+                chunk = await loop.run_in_executor(None, os.read, fd, 65536)
+                if not chunk:
                     break
-                logger.debug(f"[worker:{username}] {line.decode().rstrip()}")
+                buf += chunk
+                *lines, rest = buf.split(b"\n")
+                buf = bytearray(rest)
+                for line in lines:
+                    _log_worker_line(username, line)
+            if buf:
+                _log_worker_line(username, bytes(buf))
         except Exception:
             logger.exception(f"stderr forwarder for worker {username} crashed")
 
@@ -226,7 +226,7 @@ class TestBuildRequirementsCheck:
 
 from types import SimpleNamespace
 
-from fileglancer.apps.jobfiles import get_job_file_paths, read_job_file
+from fileglancer.apps.jobfiles import get_job_file_paths, read_job_file, read_job_file_tail
 
 
 def _fake_job(**overrides):
@@ -324,6 +324,34 @@ class TestReadJobFile:
         )
         assert read_job_file(job, "script") is None
 
+    def test_legacy_job_uses_first_script_in_work_dir(self, tmp_path):
+        (tmp_path / "b.sh").write_text("b")
+        (tmp_path / "a.sh").write_text("a")
+        (tmp_path / "stdout.log").write_text("")
+        job = _fake_job(work_dir=str(tmp_path), script_path=None)
+        assert read_job_file(job, "script") == "a"
+
+    def test_legacy_job_without_work_dir_returns_none(self, tmp_path):
+        job = _fake_job(work_dir=str(tmp_path / "missing"), script_path=None)
+        assert read_job_file(job, "script") is None
+
+    def test_tail_returns_end_and_full_size(self, tmp_path):
+        (tmp_path / "stdout.log").write_text("line1\nline2\nline3\n")
+        job = _fake_job(work_dir=str(tmp_path))
+        assert read_job_file_tail(job, "stdout", 6) == ("line3\n", 18)
+        assert read_job_file_tail(job, "stdout", 1000) == ("line1\nline2\nline3\n", 18)
+
+    def test_tail_replaces_split_multibyte_char(self, tmp_path):
+        (tmp_path / "stderr.log").write_bytes("é!".encode())
+        job = _fake_job(work_dir=str(tmp_path))
+        content, size = read_job_file_tail(job, "stderr", 2)
+        assert size == 3
+        assert content == "\ufffd!"
+
+    def test_tail_missing_file_returns_none(self, tmp_path):
+        job = _fake_job(work_dir=str(tmp_path))
+        assert read_job_file_tail(job, "stdout", 10) is None
+
 
 # --- merge_requirements tests ---
 
@@ -1506,6 +1534,38 @@ class TestOptionalFlagEmptyValue:
         assert cmd.endswith("''")
 
 
+class TestDefaultValueCaching:
+    """Manifest defaults are validated once per parameter and reused."""
+
+    def test_default_validated_once(self, monkeypatch):
+        import fileglancer.apps.command as command_mod
+        ep = AppEntryPoint(
+            id="run", name="run", command="tool",
+            parameters=[AppParameter(flag="--n", name="N", type="integer", default=4)],
+        )
+        calls = []
+        original = command_mod._validate_parameter_value
+
+        def counting(param, value, **kwargs):
+            calls.append(value)
+            return original(param, value, **kwargs)
+
+        monkeypatch.setattr(command_mod, "_validate_parameter_value", counting)
+        assert build_command(ep, {}) == "tool \\\n  --n 4"
+        assert build_command(ep, {}) == "tool \\\n  --n 4"
+        assert calls == [4]
+
+    def test_user_value_bypasses_cache(self):
+        ep = AppEntryPoint(
+            id="run", name="run", command="tool",
+            parameters=[AppParameter(flag="--n", name="N", type="integer",
+                                     default=4, max=10)],
+        )
+        build_command(ep, {})
+        with pytest.raises(ValueError):
+            build_command(ep, {"n": 11})
+
+
 class TestParameterKeyGeneration:
     """AppEntryPoint auto-generates parameter keys from the flag or a positional
     index, but honors an explicitly-authored key."""
@@ -1695,6 +1755,17 @@ class TestNextflowAdapterNaming:
             assert manifest.name == "nf-core/rnaseq"
 
 
+class TestNextflowSchemaCache:
+    def test_schema_reread_after_change(self, tmp_path):
+        schema_path = tmp_path / "nextflow_schema.json"
+        schema_path.write_text(json.dumps({"description": "v1"}))
+        assert NextflowAdapter().convert(tmp_path).description == "v1"
+        assert NextflowAdapter().convert(tmp_path).description == "v1"
+
+        schema_path.write_text(json.dumps({"description": "version 2"}))
+        assert NextflowAdapter().convert(tmp_path).description == "version 2"
+
+
 class TestEffectiveWorkingDir:
     """working_dir resolution: explicit wins; containers default to 'work',
     everything else to 'repo'."""
@@ -1718,6 +1789,26 @@ class TestEffectiveWorkingDir:
         assert ep.effective_working_dir == "work"
 
 
+class TestRunnablesById:
+    """runnables_by_id indexes entry points without leaking into the dump."""
+
+    def _manifest(self):
+        return AppManifest(name="app", runnables=[
+            AppEntryPoint(id="a", name="A", command="a"),
+            AppEntryPoint(id="b", name="B", command="b"),
+        ])
+
+    def test_lookup(self):
+        manifest = self._manifest()
+        assert manifest.runnables_by_id["b"] is manifest.runnables[1]
+        assert manifest.runnables_by_id.get("missing") is None
+
+    def test_not_serialized(self):
+        manifest = self._manifest()
+        manifest.runnables_by_id
+        assert "runnables_by_id" not in manifest.model_dump()
+
+
 from fileglancer.apps.pixi import _task_to_entry_point
 
 
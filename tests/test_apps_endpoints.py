@@ -663,6 +663,27 @@ async def test_get_or_load_manifest_cache_hit(test_app, db_session):
     assert mock_fetch.await_count == 0
 
 
+@pytest.mark.asyncio
+async def test_get_or_load_manifest_reuses_validation_until_row_changes(test_app, db_session):
+    """Repeated loads of an unchanged row share one validated manifest; a
+    changed row is re-validated."""
+    from fileglancer.apps import get_or_load_manifest
+
+    row = _seed_app(db_session, manifest=_make_manifest(name="First").model_dump(mode="json"))
+    url = "https://github.com/owner/repo"
+
+    first = await get_or_load_manifest(TEST_USERNAME, url, "")
+    again = await get_or_load_manifest(TEST_USERNAME, url, "")
+    assert again is first
+
+    row.manifest = _make_manifest(name="Second").model_dump(mode="json")
+    db_session.commit()
+
+    changed = await get_or_load_manifest(TEST_USERNAME, url, "")
+    assert changed is not first
+    assert changed.name == "Second"
+
+
 @pytest.mark.asyncio
 async def test_get_or_load_manifest_preview_no_row(test_app, db_session):
     """Preview of uninstalled URL reads disk, no row created."""
@@ -10,7 +10,7 @@ from conftest import requires_symlinks
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from fileglancer.database import *
-from fileglancer.database import _find_best_fsp_match
+from fileglancer.database import _find_best_fsp_match, _canonical_mount_path
 from fileglancer.model import FileSharePath
 from fileglancer.utils import slugify_path
 
@@ -374,6 +374,21 @@ def test_find_fsp_from_absolute_path_no_match(db_session, temp_dir):
     assert result is None
 
 
+def test_find_fsp_in_paths_resolves_each_mount_once(temp_dir):
+    """Mount paths are canonicalized once, not on every lookup"""
+    fsp = FileSharePath(zone="testzone", name="test_mount", mount_path=temp_dir)
+    target = os.path.join(temp_dir, "subdir", "file.txt")
+    _canonical_mount_path.cache_clear()
+
+    first = find_fsp_in_paths([fsp], target)
+    second = find_fsp_in_paths([fsp], target)
+
+    assert first[1] == second[1] == os.path.join("subdir", "file.txt")
+    info = _canonical_mount_path.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
 def test_find_fsp_from_absolute_path_with_home_dir(db_session):
     """Test finding FSP from absolute path with ~/ mount path"""
     # Create a file share path using ~/ which should expand to current user's home
@@ -587,3 +602,50 @@ class TestFindBestFspMatch:
         assert result is None
 
 
+def test_update_job_statuses(db_session):
+    jobs = [
+        create_job(db_session, "alice", "https://github.com/o/r", "app",
+                   "run", "Run", {})
+        for _ in range(3)
+    ]
+    finished = datetime(2026, 3, 26, 10, 5)
+
+    count = update_job_statuses(db_session, [
+        {"id": jobs[0].id, "status": "RUNNING", "exit_code": None},
+        {"id": jobs[1].id, "status": "DONE", "exit_code": 0, "finished_at": finished},
+    ])
+    assert count == 2
+
+    db_session.expire_all()
+    assert get_job(db_session, jobs[0].id, "alice").status == "RUNNING"
+    assert get_job(db_session, jobs[0].id, "alice").exit_code is None
+    done = get_job(db_session, jobs[1].id, "alice")
+    assert done.status == "DONE"
+    assert done.exit_code == 0
+    assert done.finished_at == finished
+    assert get_job(db_session, jobs[2].id, "alice").status == "PENDING"
+
+    assert update_job_statuses(db_session, []) == 0
+
+
+def test_update_job_statuses_skips_deleted_job(db_session):
+    jobs = [
+        create_job(db_session, "alice", "https://github.com/o/r", "app",
+                   "run", "Run", {})
+        for _ in range(3)
+    ]
+    assert delete_job(db_session, jobs[1].id, "alice")
+
+    count = update_job_statuses(db_session, [
+        {"id": jobs[0].id, "status": "RUNNING"},
+        {"id": jobs[1].id, "status": "DONE", "exit_code": 0},
+        {"id": jobs[2].id, "status": "FAILED", "exit_code": 1},
+    ])
+    assert count == 2
+
+    db_session.expire_all()
+    assert get_job(db_session, jobs[0].id, "alice").status == "RUNNING"
+    assert get_job(db_session, jobs[1].id, "alice") is None
+    failed = get_job(db_session, jobs[2].id, "alice")
+    assert failed.status == "FAILED"
+    assert failed.exit_code == 1
@@ -87,7 +87,8 @@ def test_app(temp_dir):
 
     # Clear the per-process filestore cache so subsequent tests don't see
     # stale Filestore instances pointing at this test's temp directory
-    from fileglancer.user_worker import _filestore_cache, _user_groups_cache
+    from fileglancer.user_worker import _filestore_cache
+    from fileglancer.filestore import _user_groups_cache
     _filestore_cache.clear()
     _user_groups_cache.clear()
 
@@ -632,6 +633,19 @@ def test_get_profile(test_client):
     assert isinstance(data["groups"], list)
 
 
+def test_get_profile_fields(test_client):
+    """Test requesting a subset of the profile fields"""
+    response = test_client.get("/api/profile?fields=username")
+    assert response.status_code == 200
+    assert list(response.json().keys()) == ["username"]
+
+    response = test_client.get("/api/profile?fields=groups,homeDirectoryName")
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data.keys()) == {"groups", "homeDirectoryName"}
+    assert isinstance(data["groups"], list)
+
+
 def test_get_notifications_no_file(test_client):
     """Test getting notifications when notifications.yaml doesn't exist"""
     response = test_client.get("/api/notifications")
@@ -690,6 +704,33 @@ def test_get_notifications_with_file(test_client, temp_dir):
             os.remove(notifications_file)
 
 
+def test_get_notifications_picks_up_edits(test_client):
+    """Cached notifications are re-read once the file changes"""
+    notifications_file = os.path.join(os.getcwd(), "notifications.yaml")
+    template = """notifications:
+  - id: 1
+    type: info
+    title: {title}
+    message: Message
+    active: true
+    created_at: 2020-01-01T00:00:00Z
+    expires_at: null
+"""
+    try:
+        with open(notifications_file, "w") as f:
+            f.write(template.format(title="First"))
+        response = test_client.get("/api/notifications")
+        assert response.json()["notifications"][0]["title"] == "First"
+
+        with open(notifications_file, "w") as f:
+            f.write(template.format(title="Second edition"))
+        response = test_client.get("/api/notifications")
+        assert response.json()["notifications"][0]["title"] == "Second edition"
+    finally:
+        if os.path.exists(notifications_file):
+            os.remove(notifications_file)
+
+
 def test_head_file_content(test_client, temp_dir):
     """Test HEAD request for file content"""
     # Create a test file
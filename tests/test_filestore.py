@@ -8,7 +8,7 @@ import shutil
 from unittest.mock import MagicMock, patch
 
 from conftest import requires_symlinks
-from fileglancer.filestore import Filestore, FileInfo
+from fileglancer.filestore import Filestore, FileInfo, _uid_to_name, _gid_to_name, _READAHEAD_WINDOW, _read_range
 from fileglancer.model import FileSharePath
 
 @pytest.fixture
@@ -96,6 +96,23 @@ def test_yield_file_infos(filestore):
         list(filestore.yield_file_infos("nonexistent"))
 
 
+def test_yield_file_infos_large_directory_keeps_order(filestore, test_dir):
+    """Listings bigger than one stat chunk come back complete and sorted."""
+    big = os.path.join(test_dir, "big")
+    os.makedirs(os.path.join(big, "zdir"))
+    for i in range(100):
+        with open(os.path.join(big, f"f{i:03d}.txt"), "w") as f:
+            f.write("x")
+
+    names = [fi.name for fi in filestore.yield_file_infos("big")]
+    assert names == ["zdir"] + [f"f{i:03d}.txt" for i in range(100)]
+
+    page, has_more, next_cursor, _, _ = filestore.yield_file_infos_paginated(
+        "big", limit=50, max_count=1000)
+    assert [fi.name for fi in page] == names[:50]
+    assert has_more and next_cursor == names[49]
+
+
 def test_stream_file_contents(filestore):
     content = b"".join(filestore.stream_file_contents("test.txt"))
     assert content == b"test content"
@@ -105,6 +122,55 @@ def test_stream_file_contents(filestore):
     assert content == b"test content 2"
 
 
+def test_stream_file_contents_grows_read_size(filestore, test_dir):
+    data = os.urandom(64 * 1024)
+    with open(os.path.join(test_dir, "big.bin"), "wb") as f:
+        f.write(data)
+
+    chunks = list(filestore.stream_file_contents("big.bin", buffer_size=4096))
+    assert b"".join(chunks) == data
+    assert [len(c) for c in chunks[:4]] == [4096, 8192, 16384, 32768]
+
+
+def test_stream_file_range_bounds_readahead(filestore, test_dir):
+    size = 3 * _READAHEAD_WINDOW + 12345
+    with open(os.path.join(test_dir, "huge.bin"), "wb") as f:
+        f.truncate(size)
+
+    advised = []
+    with patch("fileglancer.filestore._advise_read",
+               side_effect=lambda fh, offset, length, sequential=False: advised.append((offset, length))):
+        stream = filestore.stream_file_range("huge.bin", start=0, end=size - 1)
+        next(stream)
+        # Only the first window is prefetched before the client reads on
+        assert advised == [(0, _READAHEAD_WINDOW)]
+        total = 1 + sum(1 for _ in stream)
+
+    assert total > 1
+    assert all(length <= _READAHEAD_WINDOW for _, length in advised)
+    # The windows are contiguous and together cover the requested range
+    covered = 0
+    for offset, length in advised:
+        assert offset == covered
+        covered += length
+    assert covered == size
+
+
+def test_read_range_empty_does_not_advise(test_dir):
+    with open(os.path.join(test_dir, "test.txt"), "rb") as f, \
+            patch("fileglancer.filestore._advise_read") as mock_advise:
+        assert list(_read_range(f, 0, 0, 4096)) == []
+    mock_advise.assert_not_called()
+
+
+def test_check_is_binary(filestore, test_dir):
+    with open(os.path.join(test_dir, "data.bin"), "wb") as f:
+        f.write(b"\x00\x01\x02binary")
+    assert filestore.check_is_binary("test.txt") is False
+    assert filestore.check_is_binary("data.bin") is True
+    assert filestore.check_is_binary("subdir") is False
+
+
 def test_rename_file(filestore, test_dir):
     filestore.rename_file_or_dir("test.txt", "renamed.txt")
     assert not os.path.exists(os.path.join(test_dir, "test.txt"))
@@ -552,55 +618,75 @@ class TestCheckPermissions:
 
 class TestGetUserGroups:
 
+    def setup_method(self):
+        _gid_to_name.cache_clear()
+
+    def teardown_method(self):
+        _gid_to_name.cache_clear()
+
+    @patch("fileglancer.filestore.os.getgrouplist", create=True)
     @patch("fileglancer.filestore.pwd")
     @patch("fileglancer.filestore.grp")
-    def test_includes_supplementary_groups(self, mock_grp, mock_pwd):
-        """Returns groups where the user appears in gr_mem."""
-        mock_grp.getgrall.return_value = [
-            MagicMock(gr_name="staff", gr_mem=["alice", "bob"]),
-            MagicMock(gr_name="dev", gr_mem=["alice"]),
-            MagicMock(gr_name="ops", gr_mem=["charlie"]),
-        ]
+    def test_includes_supplementary_groups(self, mock_grp, mock_pwd, mock_getgrouplist):
+        """Returns the names of every gid reported by getgrouplist."""
+        names = {100: "primary", 200: "staff", 300: "dev"}
         mock_pwd.getpwnam.return_value = MagicMock(pw_gid=100)
-        mock_grp.getgrgid.return_value = MagicMock(gr_name="primary")
+        mock_getgrouplist.return_value = [100, 200, 300]
+        mock_grp.getgrgid.side_effect = lambda gid: MagicMock(gr_name=names[gid])
 
         groups = FileInfo._get_user_groups("alice")
-        assert "staff" in groups
-        assert "dev" in groups
-        assert "ops" not in groups
+        assert groups == {"primary", "staff", "dev"}
+        mock_getgrouplist.assert_called_once_with("alice", 100)
+        mock_grp.getgrall.assert_not_called()
 
+    @patch("fileglancer.filestore.os.getgrouplist", create=True)
     @patch("fileglancer.filestore.pwd")
     @patch("fileglancer.filestore.grp")
-    def test_includes_primary_group(self, mock_grp, mock_pwd):
-        """Returns the user's primary group even if not in gr_mem."""
-        mock_grp.getgrall.return_value = []
+    def test_unknown_gid_reported_by_number(self, mock_grp, mock_pwd, mock_getgrouplist):
+        """A gid with no group entry is reported as its number, like FileInfo.group."""
         mock_pwd.getpwnam.return_value = MagicMock(pw_gid=100)
-        mock_grp.getgrgid.return_value = MagicMock(gr_name="primary")
+        mock_getgrouplist.return_value = [100, 999]
+        def getgrgid(gid):
+            if gid != 100:
+                raise KeyError(gid)
+            return MagicMock(gr_name="primary")
+        mock_grp.getgrgid.side_effect = getgrgid
 
         groups = FileInfo._get_user_groups("alice")
-        assert "primary" in groups
+        assert groups == {"primary", "999"}
 
     @patch("fileglancer.filestore.pwd")
     @patch("fileglancer.filestore.grp")
     def test_handles_unknown_user(self, mock_grp, mock_pwd):
         """Returns empty set if user doesn't exist."""
-        mock_grp.getgrall.return_value = []
         mock_pwd.getpwnam.side_effect = KeyError("no such user")
 
         groups = FileInfo._get_user_groups("nonexistent")
         assert groups == set()
 
+    @patch("fileglancer.filestore.os.getgrouplist", create=True)
     @patch("fileglancer.filestore.pwd")
     @patch("fileglancer.filestore.grp")
-    def test_handles_getgrall_failure(self, mock_grp, mock_pwd):
-        """Gracefully handles grp.getgrall() failure."""
-        mock_grp.getgrall.side_effect = OSError("nss failure")
+    def test_handles_getgrouplist_failure(self, mock_grp, mock_pwd, mock_getgrouplist):
+        """Falls back to the primary group if getgrouplist fails."""
+        mock_getgrouplist.side_effect = OSError("nss failure")
         mock_pwd.getpwnam.return_value = MagicMock(pw_gid=100)
         mock_grp.getgrgid.return_value = MagicMock(gr_name="primary")
 
         groups = FileInfo._get_user_groups("alice")
-        # Still gets primary group despite getgrall failure
-        assert "primary" in groups
+        assert groups == {"primary"}
+
+    @patch("fileglancer.filestore._user_groups_cache", new_callable=dict)
+    @patch("fileglancer.filestore.FileInfo._get_user_groups")
+    def test_cached_lookup_reused(self, mock_get_groups, _cache):
+        """Group memberships are looked up once and then served from cache."""
+        mock_get_groups.return_value = {"staff"}
+
+        first = FileInfo._get_cached_user_groups("alice")
+        second = FileInfo._get_cached_user_groups("alice")
+
+        assert first == second == frozenset({"staff"})
+        mock_get_groups.assert_called_once_with("alice")
 
 
 # --- _file_info_from_direntry ---
@@ -667,3 +753,44 @@ class TestFileInfoFromDirentry:
         assert info.name == "broken_link"
         assert info.is_symlink
         assert info.symlink_target_fsp is None
+
+
+# --- uid/gid name lookups ---
+
+class TestIdNameLookups:
+
+    def setup_method(self):
+        _uid_to_name.cache_clear()
+        _gid_to_name.cache_clear()
+
+    def teardown_method(self):
+        _uid_to_name.cache_clear()
+        _gid_to_name.cache_clear()
+
+    @patch("fileglancer.filestore.pwd")
+    def test_uid_lookup_memoized(self, mock_pwd):
+        mock_pwd.getpwuid.return_value = MagicMock(pw_name="alice")
+        assert _uid_to_name(1000) == "alice"
+        assert _uid_to_name(1000) == "alice"
+        mock_pwd.getpwuid.assert_called_once_with(1000)
+
+    @patch("fileglancer.filestore.grp")
+    def test_unknown_gid_falls_back_to_number(self, mock_grp):
+        mock_grp.getgrgid.side_effect = KeyError("no such group")
+        assert _gid_to_name(4242) == "4242"
+
+
+# --- _safe_readlink ---
+
+@requires_symlinks
+class TestSafeReadlink:
+
+    def test_uses_supplied_parent_real(self, tmp_path):
+        root = os.path.realpath(tmp_path)
+        link = os.path.join(root, "link")
+        os.symlink("target.txt", link)
+
+        assert FileInfo._safe_readlink(link, root_path=root, parent_real=root) == "target.txt"
+        # A pre-resolved parent outside root is refused without re-resolving
+        outside = os.path.dirname(root)
+        assert FileInfo._safe_readlink(link, root_path=root, parent_real=outside) is None
@@ -83,6 +83,7 @@ class TestPollSkipsSameStatus:
         asyncio.run(_poll_jobs(settings))
 
         mock_db.update_job_status.assert_not_called()
+        mock_db.update_job_statuses.assert_not_called()
 
     @patch("fileglancer.apps.jobs._dispatch", new_callable=AsyncMock)
     @patch("fileglancer.apps.jobs.db")
@@ -110,9 +111,13 @@ class TestPollSkipsSameStatus:
 
         asyncio.run(_poll_jobs(settings))
 
-        mock_db.update_job_status.assert_called_once()
-        args, kwargs = mock_db.update_job_status.call_args
-        assert args == (mock_session, 1, "DONE")
+        mock_db.update_job_statuses.assert_called_once()
+        session, updates = mock_db.update_job_statuses.call_args.args
+        assert session is mock_session
+        assert len(updates) == 1
+        assert updates[0]["id"] == 1
+        assert updates[0]["status"] == "DONE"
+        assert updates[0]["exit_code"] == 0
 
     @patch("fileglancer.apps.jobs._dispatch", new_callable=AsyncMock)
     @patch("fileglancer.apps.jobs.db")
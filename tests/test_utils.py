@@ -1,5 +1,5 @@
 import pytest
-from fileglancer.utils import slugify_path, is_likely_binary
+from fileglancer.utils import slugify_path, is_likely_binary, guess_content_type, parse_range_header
 
 
 def test_slugify_path_simple():
@@ -208,3 +208,33 @@ def test_is_likely_binary_log_file():
     """Test that log file content is detected as text"""
     log_data = b"[2024-01-01 12:00:00] INFO: Server started\n[2024-01-01 12:00:01] DEBUG: Connection established\n"
     assert not is_likely_binary(log_data)
+
+
+def test_guess_content_type():
+    assert guess_content_type("image.png") == "image/png"
+    assert guess_content_type("config.yaml") in ("application/yaml", "text/plain+yaml")
+    assert guess_content_type("0.0.0") == "application/octet-stream"
+    assert guess_content_type("archive.tar.gz") == "application/x-tar"
+    # Repeated names are served from the cache with the same answer
+    assert guess_content_type("image.png") == "image/png"
+
+
+@pytest.mark.parametrize("header,expected", [
+    ("bytes=0-99", (0, 99)),
+    ("bytes=100-", (100, 999)),
+    ("bytes=-100", (900, 999)),
+    ("bytes=-5000", (0, 999)),
+    ("bytes=900-5000", (900, 999)),
+    ("bytes=0-9, 20-29", (0, 9)),
+    ("bytes= 5 - 10", (5, 10)),
+    ("bytes=-", None),
+    ("bytes=10-5", None),
+    ("bytes=1000-", None),
+    ("bytes=0-10abc", None),
+    ("bytes=5--3", None),
+    ("items=0-10", None),
+    ("", None),
+    (None, None),
+])
+def test_parse_range_header(header, expected):
+    assert parse_range_header(header, 1000) == expected
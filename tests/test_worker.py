@@ -457,6 +457,14 @@ class TestActionHandlers:
         assert "groups" in result
         assert isinstance(result["groups"], list)
 
+    def test_get_profile_groups_match_file_info(self, ctx):
+        """The profile and listing permission checks share one group lookup."""
+        from fileglancer.filestore import FileInfo
+        handler = _ACTIONS["get_profile"]
+        result = handler({"action": "get_profile", "fields": ["groups"]}, ctx)
+        expected = FileInfo._get_cached_user_groups(ctx.username)
+        assert result["groups"] == sorted(expected)
+
     def test_unknown_action(self):
         """Unknown actions are not in the registry."""
         assert "nonexistent_action" not in _ACTIONS
@@ -637,3 +645,66 @@ class TestValidateProxiedPathAction:
         result = _action_validate_proxied_path(
             {"fsp_name": "vpp_symlink", "path": "link.txt"}, ctx)
         assert result == {"ok": True}
+
+
+class TestPollAction:
+    """The poll action reports only jobs whose status changed."""
+
+    def test_unchanged_statuses_omitted(self, monkeypatch):
+        from types import SimpleNamespace
+        from cluster_api import JobStatus
+        import fileglancer.user_worker as user_worker
+
+        class FakeExecutor:
+            def __init__(self):
+                self.jobs = {}
+
+            def track(self, cid, status):
+                self.jobs[cid] = SimpleNamespace(
+                    status=status, exit_code=None, exec_host=None,
+                    start_time=None, finish_time=None,
+                )
+
+            async def poll(self):
+                self.jobs["2"].status = JobStatus.DONE
+                self.jobs["2"].exit_code = 0
+
+        monkeypatch.setattr(user_worker, "_get_executor", lambda request: FakeExecutor())
+        result = _ACTIONS["poll"]({
+            "cluster_config": {},
+            "cluster_job_ids": ["1", "2"],
+            "job_statuses": {"1": "RUNNING", "2": "RUNNING"},
+        }, WorkerContext(username="test", db=None))
+
+        assert list(result["jobs"]) == ["2"]
+        assert result["jobs"]["2"]["status"] == "done"
+        assert result["jobs"]["2"]["exit_code"] == 0
+
+
+class TestForwardStderr:
+    """Worker stderr is split into lines and forwarded to loguru."""
+
+    @pytest.mark.asyncio
+    async def test_lines_forwarded_including_partial_tail(self):
+        import subprocess
+        from loguru import logger
+
+        messages = []
+        sink_id = logger.add(lambda m: messages.append(m.record["message"]), level="DEBUG")
+        try:
+            proc = subprocess.Popen(
+                [sys.executable, "-c",
+                 "import sys; sys.stderr.write('one\\r\\ntwo\\n\\xe9\\nlast')"],
+                stderr=subprocess.PIPE,
+            )
+            await WorkerPool._forward_stderr(None, "alice", proc)
+            proc.wait()
+        finally:
+            logger.remove(sink_id)
+
+        assert messages == [
+            "[worker:alice] one",
+            "[worker:alice] two",
+            "[worker:alice] é",
+            "[worker:alice] last",
+        ]